@@ -1,9 +1,112 @@
 import sys
+import array
+import collections
+import heapq
+import itertools
 import puzz
-import pdqpq
 
 
 GOAL_STATE = puzz.EightPuzzleBoard("012345678")
+ORD0 = ord("0")
+
+
+def _key(board):
+    """Pack a board into an int, 4 bits per cell, with cell i of str(board) in bits 4*i..4*i+3."""
+    k = 0
+    for i, c in enumerate(str(board)):
+        k |= (ord(c) - ORD0) << (4*i)  # cheaper than int(c) for a single digit
+    return k
+
+
+def _board(k):
+    """Unpack a state produced by _key() back into an EightPuzzleBoard."""
+    return puzz.EightPuzzleBoard("".join(str((k >> (4*i)) & 0xF) for i in range(9)))
+
+
+def _blank(k):
+    """Return the index of the blank cell in a packed state."""
+    for i in range(9):
+        if (k >> (4*i)) & 0xF == 0:
+            return i
+
+
+def _legal_moves(blank):
+    """Return (move, cell of the tile that moves) pairs for a blank in the given cell."""
+    col, row = blank % 3, blank // 3  # row 0 is the top of the board
+    moves = []
+    if row < 2:
+        moves.append(("up", blank + 3))  # tile below the blank moves up
+    if row > 0:
+        moves.append(("down", blank - 3))  # tile above the blank moves down
+    if col < 2:
+        moves.append(("left", blank + 1))  # tile right of the blank moves left
+    if col > 0:
+        moves.append(("right", blank - 1))  # tile left of the blank moves right
+    return moves
+
+
+MOVES = [_legal_moves(blank) for blank in range(9)]  # blank cell -> legal (move, cell) pairs
+
+
+def _successors(k):
+    """Generate the successors of a packed state without building any boards.
+
+    A successor is made by moving a neighbouring tile's nibble into the blank cell.
+
+    Returns: a list of (move, successor state, moved tile, cell it moved from, cell it moved to)
+        tuples, in the same move order as EightPuzzleBoard.successors()
+    """
+    blank = _blank(k)
+    succs = []
+    for move, cell in MOVES[blank]:
+        tile = (k >> (4*cell)) & 0xF
+        succ = k & ~(0xF << (4*cell)) | (tile << (4*blank))  # the blank's nibble is 0
+        succs.append((move, succ, tile, cell, blank))
+    return succs
+
+
+def _move_cost(k, succ):
+    """Return the cost of moving from packed state k to its successor succ."""
+    tile = (succ >> (4*_blank(k))) & 0xF  # the moved tile ends up where the blank was
+    return tile*tile
+
+
+GOAL_KEY = _key(GOAL_STATE)
+INVERSE_MOVE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+MOVE_NAMES = ["up", "down", "left", "right"]
+MOVE_INDEX = {move: i for i, move in enumerate(MOVE_NAMES)}  # move -> compact code for the tree
+
+# Contribution of a tile to each heuristic when it sits in a given cell, indexed [tile][cell].  The
+# goal state has tile t in cell t, and the blank never counts.
+MISPLACED = [[int(t != 0 and t != c) for c in range(9)] for t in range(9)]
+MANHATTAN = [[(t != 0) * (abs(c % 3 - t % 3) + abs(c // 3 - t // 3)) for c in range(9)]
+             for t in range(9)]
+WEIGHTED_MANHATTAN = [[t*t * MANHATTAN[t][c] for c in range(9)] for t in range(9)]
+
+
+def _num_misplaced_tiles(k):
+    """h1: the number of tiles (excluding the blank) that are not in their goal cell."""
+    diff = k ^ GOAL_KEY  # nibbles are nonzero exactly where the tile differs from the goal
+    misplaced = (diff | (diff >> 1) | (diff >> 2) | (diff >> 3)) & 0x111111111  # 1 bit per cell
+    misplaced &= ~(1 << (4*_blank(k)))  # the blank doesn't count
+    return bin(misplaced).count("1")
+
+
+def _manhattan_distance(k):
+    """h2: the sum of the Manhattan distances of each tile from its goal cell."""
+    return sum(MANHATTAN[(k >> (4*i)) & 0xF][i] for i in range(9))
+
+
+def _worse_manhattan(k):
+    """h3: like h2, but each tile's distance is weighted by the square of its number."""
+    return sum(WEIGHTED_MANHATTAN[(k >> (4*i)) & 0xF][i] for i in range(9))
+
+
+HEURISTICS = {  # heuristic tag -> (full heuristic, per-tile contribution table)
+    'h1': (_num_misplaced_tiles, MISPLACED),
+    'h2': (_manhattan_distance, MANHATTAN),
+    'h3': (_worse_manhattan, WEIGHTED_MANHATTAN),
+}
 
 
 def solve_puzzle(start_state, flavor):
@@ -55,10 +158,16 @@ class BreadthFirstSolver:
     """Implementation of Breadth-First Search based puzzle solver"""
 
     def __init__(self):
-        self.goal = GOAL_STATE
-        self.parents = {}  # state -> parent_state
-        self.frontier = pdqpq.FifoQueue()
-        self.explored = set()
+        self.goal = GOAL_KEY
+        # The search tree is stored column-wise: each state reached gets the next integer id, and
+        # the per-state lists/arrays below are all indexed by that id.
+        self.state_ids = {}  # state -> id
+        self.states = []  # id -> state
+        self.parents = array.array('l')  # id -> id of the parent state, -1 for the start state
+        self.moves = bytearray()  # id -> MOVE_INDEX of the move from the parent to the state
+        self.g = array.array('l')  # id -> cost of the cheapest known path from the start state
+        self.explored = bytearray()  # id -> 1 once the state has been expanded
+        self.frontier = collections.deque()
         self.frontier_count = 0  # increment when we add something to frontier
         self.expanded_count = 0  # increment when we pull something off frontier and expand
     
@@ -71,47 +180,133 @@ class BreadthFirstSolver:
         Returns:
             A dictionary describing the search from the start state to the goal state.
 
-        """
-
-        self.parents[start_state] = None
-        self.add_to_frontier(start_state)
+        The search is bidirectional: it runs breadth-first from both the start state and the goal
+        state, expanding one whole layer at a time on whichever side has the smaller frontier,
+        and stops as soon as a successor on one side has already been reached by the other.
 
-        if start_state == self.goal:  # edge case        
-            return self.get_results_dict(start_state)
+        """
 
-        while not self.frontier.is_empty():
-            node = self.frontier.pop()  # get the next node in the frontier queue
-            succs = self.expand_node(node)
+        start = self.add_state(_key(start_state), -1, None, 0)
+        self.add_to_frontier(start)
 
-            for move, succ in succs.items():
-                if (succ not in self.frontier) and (succ not in self.explored):
-                    self.parents[succ] = node
+        if self.states[start] == self.goal:  # edge case        
+            return self.get_results_dict(start)
 
-                    # BFS checks for goal state _before_ adding to frontier
-                    if succ == self.goal:
-                        return self.get_results_dict(succ)
-                    else:
-                        self.add_to_frontier(succ)
+        # the goal side of the search shares the search tree, its parent links point towards the
+        # goal and from_goal marks which states it reached
+        goal = self.add_state(self.goal, -1, None, 0)
+        goal_frontier = collections.deque([goal])
+        self.frontier_count += 1
+        from_goal = bytearray(len(self.states))
+        from_goal[goal] = 1
+
+        while self.frontier and goal_frontier:
+            if len(self.frontier) <= len(goal_frontier):
+                meet = self._expand_layer(self.frontier, from_goal, 0)
+            else:
+                meet = self._expand_layer(goal_frontier, from_goal, 1)
+
+            if meet is not None:
+                self._join_goal_side(*meet)
+                path = self._get_path_ids(goal)
+                for i in range(1, len(path)):
+                    node, succ = path[i-1], path[i]
+                    self.g[succ] = self.g[node] + _move_cost(self.states[node], self.states[succ])
+                return self.get_results_dict(goal)
 
         # if we get here, the search failed
         return self.get_results_dict(None) 
 
+    def _expand_layer(self, frontier, from_goal, side):
+        """Expand every state in the current layer of one side of a bidirectional search.
+
+        Args:
+            frontier (deque): frontier of the side being expanded, holding exactly one layer
+            from_goal (bytearray): id -> 1 for states reached by the goal side, 0 otherwise
+            side (int): 1 if this is the goal side, 0 if it is the start side
+
+        Returns:
+            (start side state, move, goal side state) ids for the first edge found between the
+            two sides, or None
+
+        """
+        for _ in range(len(frontier)):
+            node = frontier.popleft()  # get the next node in the frontier queue
+            for move, succ_key, step in self.expand_node(node):
+                succ = self.state_ids.get(succ_key)
+                if succ is None:
+                    succ = self.add_state(succ_key, node, move, 0)
+                    from_goal.append(side)
+                    frontier.append(succ)
+                    self.frontier_count += 1
+                elif from_goal[succ] != side:
+                    if side:
+                        return succ, INVERSE_MOVE[move], node
+                    return node, move, succ
+        return None
+
+    def _join_goal_side(self, node, move, succ):
+        """Reverse the goal side's parent links from succ to the goal and hang them off node.
+
+        Afterwards the goal is in the start side's search tree, reached from node by move.
+        """
+        while succ != -1:
+            next_succ = self.parents[succ]
+            next_move = INVERSE_MOVE[MOVE_NAMES[self.moves[succ]]] if next_succ != -1 else None
+            self.parents[succ] = node
+            self.moves[succ] = MOVE_INDEX[move]
+            node, move, succ = succ, next_move, next_succ
+
+    def add_state(self, state, parent, move, cost):
+        """Give a newly reached state an id and record it in the search tree.
+
+        Args:
+            state (int): the state's _key()
+            parent (int): id of the parent state, -1 for a root of the search
+            move (str): the move from the parent to the state, None for a root
+            cost (int): cost of the path to the state
+
+        Returns:
+            The id of the state
+
+        """
+        sid = len(self.states)
+        self.state_ids[state] = sid
+        self.states.append(state)
+        self.parents.append(parent)
+        self.moves.append(MOVE_INDEX[move] if move else 0)
+        self.g.append(cost)
+        self.explored.append(0)
+        return sid
+
+    def set_parent(self, sid, parent, move, cost):
+        """Point a state at a cheaper path through a different parent."""
+        self.parents[sid] = parent
+        self.moves[sid] = MOVE_INDEX[move]
+        self.g[sid] = cost
+
     def add_to_frontier(self, node):
         """Add state to frontier and increase the frontier count."""
-        self.frontier.add(node)
+        self.frontier.append(node)
         self.frontier_count += 1
 
     def expand_node(self, node):
-        """Get the next state from the frontier and increase the expanded count."""
-        self.explored.add(node)
+        """Get the next state from the frontier and increase the expanded count.
+
+        Successors are generated directly on the packed state (see _successors()), and the
+        transition cost is the square of the number on the moved tile.
+
+        Returns: a list of (move, successor state, transition cost) tuples
+        """
+        self.explored[node] = 1
         self.expanded_count += 1
-        return node.successors()
+        return [ (move, succ, tile*tile) for move, succ, tile, _, _ in _successors(self.states[node]) ]
 
     def get_results_dict(self, state):
         """Construct the output dictionary for solve_puzzle()
         
         Args:
-            state (EightPuzzleBoard): final state in the search tree
+            state (int): id of the final state in the search tree
         
         Returns:
             A dictionary describing the search performed (see solve_puzzle())
@@ -120,11 +315,11 @@ class BreadthFirstSolver:
         results = {}
         results['frontier_count'] = self.frontier_count
         results['expanded_count'] = self.expanded_count
-        if state:
+        if state is not None:
             results['path_cost'] = self.get_cost(state)
-            path = self.get_path(state)
-            moves = ['start'] + [ path[i-1].get_move(path[i]) for i in range(1, len(path)) ]
-            results['path'] = list(zip(moves, path))
+            path = self._get_path_ids(state)
+            moves = ['start'] + [ MOVE_NAMES[self.moves[sid]] for sid in path[1:] ]
+            results['path'] = list(zip(moves, self.get_path(state)))
         return results
 
     def get_path(self, state):
@@ -134,236 +329,212 @@ class BreadthFirstSolver:
         state for the serach at the root.
         
         Args:
-            state (EightPuzzleBoard): target state in the search tree
+            state (int): id of the target state in the search tree
         
         Returns:
             A list of EightPuzzleBoard objects representing the path from the start state to the
             target state
 
         """
+        return [_board(self.states[sid]) for sid in self._get_path_ids(state)]
+
+    def _get_path_ids(self, state):
+        """Return the ids of the states on the path from the start state to a target."""
         path = []
-        while state is not None:
+        while state != -1:
             path.append(state)
             state = self.parents[state]
         path.reverse()
         return path
 
     def get_cost(self, state): 
-        """Calculate the path cost from start state to a target state.
+        """Return the path cost from start state to a target state.
         
         Transition costs between states are equal to the square of the number on the tile that 
-        was moved. 
+        was moved.  They are accumulated into self.g as each edge is relaxed, so this is just a
+        lookup.
 
         Args:
-            state (EightPuzzleBoard): target state in the search tree
+            state (int): id of the target state in the search tree
         
         Returns:
             Integer indicating the cost of the solution path
 
         """
-        cost = 0
-        path = self.get_path(state)
-        for i in range(1, len(path)):
-            x, y = path[i-1].find(None)  # the most recently moved tile leaves the blank behind
-            tile = path[i].get_tile(x, y)        
-            cost += int(tile)**2
-        return cost
+        return self.g[state]
+
 
 class UniformCostSolver(BreadthFirstSolver):
     def __init__(self):
         super().__init__()
-        #switch to a priority queue for UCS
-        self.frontier = pdqpq.PriorityQueue()
+        #switch to a priority queue for UCS, a heap of (priority, count, state id) entries
+        self.frontier = []
+        self.front_prio = {}  # state id -> current priority of the state in the frontier
+        self.counter = itertools.count()  # breaks priority ties in insertion order
 
     def solve(self, start_state):
-        self.parents[start_state] = None
-        self.add_to_frontier(start_state)
+        start = self.add_state(_key(start_state), -1, None, 0)
+        self.add_to_frontier(start)
 
-        if start_state == self.goal:  # edge case        
-            return self.get_results_dict(start_state)
+        if self.states[start] == self.goal:  # edge case        
+            return self.get_results_dict(start)
 
-        while not self.frontier.is_empty():
+        while self.front_prio:
 
-            node = self.frontier.pop()  # get the next node in the frontier queue
+            node = self.pop_frontier()  # get the next node in the frontier queue
+            #the first time the goal is popped its path is final, no need to expand it
+            if self.states[node] == self.goal:
+                return self.get_results_dict(node)
             #successor states to current node, also adds node to list of explored states
             succs = self.expand_node(node)
-            if node == self.goal:
-                return self.get_results_dict(node)
 
-            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor boards for those 4 moves
-            for move, succ in succs.items():
-                alt_cost = self.get_cost(node) + self._transition_cost(node, move)
+            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor states for those 4 moves, step is the cost of the move
+            for move, succ_key, step in succs:
+                alt_cost = self.g[node] + step
+                succ = self.state_ids.get(succ_key)
+                #successor has no id yet, so this is the first time seeing it, add it to the frontier
+                if succ is None:
+                    succ = self.add_state(succ_key, node, move, alt_cost)
+                    self.add_to_frontier(succ, alt_cost)
+
                 #if the current successor has already been explored
-                if (succ in self.explored):
+                elif self.explored[succ]:
                     #if the successor has already been explored, not possible to get a cheaper path from a higher priority node
                     continue
 
-                #current successor has not been explored
+                #otherwise the successor is in the frontier, check to see if the frontier cost is cheapeer
                 else:
-                    #check to see if the frontier cost is cheapeer
-                    if (succ in self.frontier):
-                        cur_front_cost = self.frontier.get(succ)
-                        #if the current cost in the frontier than it would be if we took this alternative path for succ, replace cur frontier entry for succ with a new cost one
-                        if (cur_front_cost > alt_cost):
-                            self.parents[succ] = node
-                            self.frontier.remove(succ)
-                            self.frontier.add(succ, self.get_cost(succ))
-
-
-                    #successor is not in frontier and has not been explored, so this is the first time seeing it, add it to the frontier
-                    else:
-                        self.parents[succ] = node
-                        self.frontier_count += 1
-                        self.frontier.add(succ, self.get_cost(succ))
+                    cur_front_cost = self.front_prio[succ]
+                    #if the current cost in the frontier than it would be if we took this alternative path for succ, replace cur frontier entry for succ with a new cost one
+                    if (cur_front_cost > alt_cost):
+                        self.set_parent(succ, node, move, alt_cost)
+                        self.update_frontier(succ, alt_cost)
 
         # if we get here, the search failed
         return self.get_results_dict(None) 
 
-    def _transition_cost(self, state, move):
-        #first find where the 0 is, bottom left of board is x = 0, y = 0
-        x = state.find("0")[0]
-        y = state.find("0")[1]
-        if move == "up":
-            #tile to be moved is under the 0
-            return int(state.get_tile(x, y-1))**2
-        elif move == "down": 
-            #tile to be moved is above the 0
-            return int(state.get_tile(x, y+1))**2
-        elif move == "left":
-            #tile to be moved is to the right of the 0
-            return int(state.get_tile(x+1, y))**2
-        elif move == "right": 
-            #tile to be moved is to the left of the the 0
-            return int(state.get_tile(x-1, y))**2
-        else:
-            print("error in _transition_cost")
-        
-        
+    def add_to_frontier(self, node, priority=0):
+        """Add state to frontier with a given priority and increase the frontier count."""
+        heapq.heappush(self.frontier, (priority, next(self.counter), node))
+        self.front_prio[node] = priority
+        self.frontier_count += 1
+
+    def update_frontier(self, node, priority):
+        """Change the priority of a state that is already in the frontier."""
+        #the old heap entry is left in place, pop_frontier() skips it once it is stale
+        heapq.heappush(self.frontier, (priority, next(self.counter), node))
+        self.front_prio[node] = priority
+
+    def pop_frontier(self):
+        """Remove and return the lowest priority state in the frontier."""
+        while True:
+            priority, _, node = heapq.heappop(self.frontier)
+            #front_prio is the source of truth, anything that disagrees with it is stale
+            if self.front_prio.get(node) == priority:
+                del self.front_prio[node]
+                return node
+
+
 class GreedySolver(UniformCostSolver):
     def __init__(self):
         super().__init__()
-        self.frontier = pdqpq.PriorityQueue()
+        self.h = array.array('l')  # id -> heuristic value of the state
+        self.h_fn = None  # full heuristic, only needed for the start state
+        self.h_table = None  # per-tile contributions, used to update the heuristic incrementally
 
     def solve(self, start_state, heur):
-        self.parents[start_state] = None
-        self.add_to_frontier(start_state)
+        self._select_heuristic(heur)
+        start_key = _key(start_state)
+        start = self.add_state(start_key, -1, None, 0, self.h_fn(start_key))
+        self.add_to_frontier(start)
 
-        if start_state == self.goal:  # edge case        
-            return self.get_results_dict(start_state)
+        if self.states[start] == self.goal:  # edge case        
+            return self.get_results_dict(start)
 
-        while not self.frontier.is_empty():
+        while self.front_prio:
 
-            node = self.frontier.pop()  # get the next node in the frontier queue
+            node = self.pop_frontier()  # get the next node in the frontier queue
+            #the first time the goal is popped its path is final, no need to expand it
+            if self.states[node] == self.goal:
+                return self.get_results_dict(node)
             #successor states to current node, also adds node to list of explored states
             succs = self.expand_node(node)
-            if node == self.goal:
-                return self.get_results_dict(node)
 
-            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor boards for those 4 moves
-            for move, succ in succs.items():
-                #maybe take out
-                if (not succ in self.frontier) and (not succ in self.explored):    
-                    heuristic = self._heuristic(succ, heur)
-                    self.parents[succ] = node
-                    self.frontier_count += 1
-                    self.frontier.add(succ, heuristic)        
+            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor states for those 4 moves, step is the cost of the move, heuristic is the successor's heuristic
+            for move, succ_key, step, heuristic in succs:
+                #states that already have an id are in the frontier or explored
+                if succ_key not in self.state_ids:
+                    succ = self.add_state(succ_key, node, move, self.g[node] + step, heuristic)
+                    self.add_to_frontier(succ, heuristic)
 
         return self.get_results_dict(None) 
 
-    def _heuristic(self, trans, heur):
-        #misplaced tiles
-        if (heur == "h1"):
-            return self._num_misplaced_tiles(trans)
-        elif (heur == "h2"):
-            return self._manhattan_distance(trans)
-        elif (heur == "h3"):
-            return self._worse_manhattan(trans)
-        else:
-            print("error, heur was invalid in A*")
-
-    def _num_misplaced_tiles(self, state):  
-        num_misplaced_tiles = 0
-        for x in range(0,3):
-            for y in range(0,3):
-                num_tile = int(state.get_tile(x,y))
-                if (num_tile != 0) and (state.get_tile(x,y) != GOAL_STATE.get_tile(x,y)):
-                    num_misplaced_tiles += 1
-        return num_misplaced_tiles
-
-    def _manhattan_distance(self, state):
-        manhattan_distance = 0
-        for x in range(0,3):
-            for y in range(0,3):
-                cur_tile = state.get_tile(x,y)
-                x_coords = GOAL_STATE.find(cur_tile)[0]
-                y_coords = GOAL_STATE.find(cur_tile)[1]
-                num_tile = int(cur_tile)
-                if num_tile != 0:
-                    manhattan_distance += abs(x - x_coords) + abs(y - y_coords)
-        return manhattan_distance
-
-    def _worse_manhattan(self, state):
-        manhattan_distance = 0
-        for x in range(0,3):
-            for y in range(0,3):
-                cur_tile = state.get_tile(x,y)
-                x_coords = GOAL_STATE.find(cur_tile)[0]
-                y_coords = GOAL_STATE.find(cur_tile)[1]
-                diff = abs(x - x_coords) + abs(y - y_coords)
-                num_tile = int(cur_tile)
-                manhattan_distance += num_tile**2 * diff
-        return manhattan_distance
+    def add_state(self, state, parent, move, cost, heuristic=0):
+        """Record a new state like BreadthFirstSolver.add_state(), along with its heuristic."""
+        self.h.append(heuristic)
+        return super().add_state(state, parent, move, cost)
 
+    def expand_node(self, node):
+        """Expand a state like BreadthFirstSolver.expand_node(), also computing successor heuristics.
 
-class AStarSolver(GreedySolver):
-    def __init__(self):
-        super().__init__()
-        self.frontier = pdqpq.PriorityQueue()
+        Only one tile moves between a state and its successor, so the successor's heuristic is
+        the parent's plus the change in the moved tile's contribution.
 
+        Returns: a list of (move, successor state, transition cost, successor heuristic) tuples
+        """
+        self.explored[node] = 1
+        self.expanded_count += 1
+        h_node = self.h[node]
+        h_table = self.h_table
+        return [ (move, succ, tile*tile, h_node + h_table[tile][dst] - h_table[tile][src])
+                 for move, succ, tile, src, dst in _successors(self.states[node]) ]
+
+    def _select_heuristic(self, heur):
+        #pick the heuristic once per search instead of checking the tag for every successor
+        if heur not in HEURISTICS:
+            raise ValueError("Unknown heuristic '{}'".format(heur))
+        self.h_fn, self.h_table = HEURISTICS[heur]
+
+
+class AStarSolver(GreedySolver):
     def solve(self, start_state, heur):
-        self.parents[start_state] = None
-        self.add_to_frontier(start_state)
+        self._select_heuristic(heur)
+        start_key = _key(start_state)
+        start = self.add_state(start_key, -1, None, 0, self.h_fn(start_key))
+        self.add_to_frontier(start)
 
-        if start_state == self.goal:  # edge case        
-            return self.get_results_dict(start_state)
+        if self.states[start] == self.goal:  # edge case        
+            return self.get_results_dict(start)
 
-        while not self.frontier.is_empty():    
+        while self.front_prio:
 
-            node = self.frontier.pop()
-            succs = self.expand_node(node)
-            if node == self.goal:
+            node = self.pop_frontier()
+            #the first time the goal is popped its path is final, no need to expand it
+            if self.states[node] == self.goal:
                 return self.get_results_dict(node)
+            succs = self.expand_node(node)
 
-            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor boards for those 4 moves
-            for move, succ in succs.items(): 
-                #node has not been explored
-                if not succ in self.explored:
-                    #successor is in frontier
-                    if succ in self.frontier:
-                        #heuristic to succ
-                        succ_heuristic = self._heuristic(succ, heur)
-                        #cost of moving from from node to succ
-                        trans_to_succ = self._transition_cost(node, move)
-                        #alternate priority in the queue
-                        alt_priority = self.get_cost(node) + succ_heuristic + trans_to_succ
-                        if (alt_priority < self.frontier.get(succ)):
-                            self.parents[succ] = node
-                            self.frontier.remove(succ)
-                            self.frontier.add(succ, alt_priority)
-
-                    #otherwise successor is not in frontier, first time seeing it
-                    else:
-                        self.parents[succ] = node
-                        cost_to_succ = self.get_cost(succ)
-                        succ_heuristic = self._heuristic(succ, heur)
-                        succ_priority = cost_to_succ + succ_heuristic
-                        self.frontier_count += 1
-                        self.frontier.add(succ, succ_priority)
+            #move is a stirng which is either left, right, up, or down, successor is the (max 4) successor states for those 4 moves, step is the cost of the move, succ_heuristic is the successor's heuristic
+            for move, succ_key, step, succ_heuristic in succs: 
+                #cost of the path to succ through node
+                alt_g = self.g[node] + step
+                #alternate priority in the queue
+                alt_priority = alt_g + succ_heuristic
+                succ = self.state_ids.get(succ_key)
+                #successor has no id yet, first time seeing it
+                if succ is None:
+                    succ = self.add_state(succ_key, node, move, alt_g, succ_heuristic)
+                    self.add_to_frontier(succ, alt_priority)
 
                 #node has already been explored
-                else:
+                elif self.explored[succ]:
                     continue
 
+                #otherwise successor is in frontier
+                elif (alt_priority < self.front_prio[succ]):
+                    self.set_parent(succ, node, move, alt_g)
+                    self.update_frontier(succ, alt_priority)
+
         return self.get_results_dict(None) 
 
     